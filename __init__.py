@@ -1,3 +1,3 @@
 # Imports for dgraphpy package
 
-from .dgraphpy.classes import Server, Endpoint, Query, Mutation, SchemaQuery, Schema
+from .dgraphpy.classes import Server, Endpoint, AsyncEndpoint, Query, Mutation, SchemaQuery, Schema
@@ -1,15 +1,80 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+import asyncio
+import concurrent.futures
 from dotenv import load_dotenv
+import functools
+import hashlib
+import importlib.util
 import os
+import re
+import sys
+import threading
+import types
+from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+
+# orjson is optional, but decodes large responses (e.g. generated schemas) considerably faster than the json module
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# httpx is optional, and only needed for AsyncEndpoint
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+# Connections kept open per host by each Server's or Endpoint's session
+_POOL_MAXSIZE: int = 32
+
+# Maximum number of SchemaQuerys sent at once by Schema.from_SchemaQueries. Must not exceed _POOL_MAXSIZE.
+_MAX_SCHEMA_QUERY_WORKERS: int = 8
+
+
+def _new_session() -> requests.Session:
+    """
+    Build a requests Session with a pooled HTTP adapter, so repeated operations against the same host reuse
+    connections instead of opening a new one per request.
+
+    :return: Session with default headers set and pooled adapters mounted for http:// and https://.
+    :rtype: requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=_POOL_MAXSIZE)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update(Server.headers)
+    return session
+
+
+# Headers sent with every operation. Read-only via Server.headers; build a new dict to add to them.
+_BASE_HEADERS: dict[str, str] = {
+    "Content-Type": "application/graphql",
+}
+
+
+@functools.cache
+def _auth_token() -> str | None:
+    """
+    Get the X-Auth-Token API token, loading .env into the environment first. Cached so the file is only read and
+    the token only looked up once per process.
+
+    :return: Value of the X_AUTH_TOKEN environment variable, or None if not set.
+    :rtype: str | None
+    """
+    load_dotenv()
+    return os.getenv('X_AUTH_TOKEN')
 
 
 class Server:
-    headers: dict = {
-        "Content-Type": "application/graphql",
-    }
+    headers: types.MappingProxyType = types.MappingProxyType(_BASE_HEADERS)
 
     def __init__(self, url: str):
         if url is None:
@@ -18,48 +83,246 @@ class Server:
         self.admin_endpoint: str = f'{self.url}/admin'
         self.graphql_endpoint: str = f'{self.url}/graphql'
         self.alter_endpoint: str = f'{self.url}/alter'
+        self._valid_endpoints: frozenset[str] = frozenset((self.admin_endpoint, self.graphql_endpoint,
+                                                           self.alter_endpoint))
+
+        self._session: requests.Session = _new_session()
 
     def post(self, endpoint_url: str, operation: GraphQLOperation) -> dict:
-        if endpoint_url not in [self.admin_endpoint, self.graphql_endpoint, self.alter_endpoint]:
+        if endpoint_url not in self._valid_endpoints:
             raise AttributeError
 
         headers = getattr(operation, 'headers', Server.headers)
 
-        response = requests.post(url=endpoint_url, data=operation.text, headers=headers)
+        response = self._session.post(url=endpoint_url, data=operation.text_bytes, headers=headers)
         if response.status_code == 200:
-            resp_json = response.json()
-            if 'errors' in list(resp_json.keys()):
+            resp_json = _json_loads(response.content)
+            if 'errors' in resp_json:
                 errors: list[dict] = resp_json["errors"]
-                all_errors_text: str = "\n".join([error["message"] for error in errors])
+                all_errors_text: str = "\n".join(error["message"] for error in errors)
                 raise RuntimeError(f'Error raised by server: {all_errors_text}')
-            return response.json()
+            return resp_json
         else:
             raise RuntimeError(f'HTTP status code was not 200 ({response.status_code})')
 
+    def close(self):
+        """
+        Close this server's HTTP session, releasing its pooled connections.
+        """
+        self._session.close()
+
+    def __enter__(self) -> Server:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
 
 class Endpoint:
+    __slots__ = ('url', '_session')
+
     def __init__(self, url: str):
         self.url: str = url
+        self._session: requests.Session = _new_session()
 
     def post(self, operation: GraphQLOperation):
-        response = requests.post(url=self.url, data=operation.text, headers=Server.headers)
-        return response.json()
+        # Per-operation headers (e.g. SchemaQuery's X-Auth-Token) are merged over the session's defaults
+        response = self._session.post(url=self.url, data=operation.text_bytes, headers=operation.headers)
+        return _json_loads(response.content)
+
+    def post_batch(self, operations: list[GraphQLOperation]) -> list[dict]:
+        """
+        Send several operations with one HTTP POST per operation type, rather than one per operation.
+
+        Operations of the same type (e.g. all queries) are combined into a single document, with each aliased by its
+        position so its result can be picked back out of the response. Operations with their own headers can't share
+        a request, so are sent individually.
+
+        :param operations: Queries and/or mutations to send.
+        :type operations: list[GraphQLOperation]
+        :return: JSON response for each operation, in the same order as operations.
+        :rtype: list[dict]
+        """
+        responses: list[dict | None] = [None] * len(operations)
+
+        batches: dict[str, list[int]] = {}
+        individual: list[int] = []
+        for index, operation in enumerate(operations):
+            if operation.headers is not None:
+                individual.append(index)
+            else:
+                batches.setdefault(operation.gql_type, []).append(index)
+
+        # Build every batch document before sending anything, so nothing is committed if a later one fails to build
+        batch_bodies: dict[str, bytes] = {}
+        for gql_type, indices in batches.items():
+            fields_text: str = '\n'.join(f'a{index}: {operations[index].name}{operations[index].arguments}'
+                                         f'{operations[index].return_fields_text}' for index in indices)
+            batch_bodies[gql_type] = f'{gql_type} Batch {{{fields_text}}}'.encode('utf-8')
+
+        for index in individual:
+            responses[index] = self.post(operations[index])
+
+        for gql_type, indices in batches.items():
+            batch_response = self._session.post(url=self.url, data=batch_bodies[gql_type])
+            batch_json: dict = _json_loads(batch_response.content)
+
+            # Split the combined response back into one response per operation, each error going to the operation
+            # at the start of its path, or to every operation if it has no path
+            data: dict = batch_json.get('data') or {}
+            errors: dict[str, list[dict]] = {}
+            for error in batch_json.get('errors', []):
+                path: list = error.get('path') or []
+                for index in indices:
+                    if not path or path[0] == f'a{index}':
+                        errors.setdefault(f'a{index}', []).append(error)
+
+            for index in indices:
+                response: dict = {'data': {operations[index].name: data.get(f'a{index}')}}
+                if f'a{index}' in errors:
+                    response['errors'] = errors[f'a{index}']
+                responses[index] = response
+
+        return responses
+
+    def close(self):
+        """
+        Close this endpoint's HTTP session, releasing its pooled connections.
+        """
+        self._session.close()
+
+    def __enter__(self) -> Endpoint:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class AsyncEndpoint:
+    __slots__ = ('url', '_client')
+
+    def __init__(self, url: str):
+        """
+        Endpoint for sending operations concurrently from asyncio code, over a single httpx client. Uses HTTP/2 if the
+        h2 package is installed, so concurrent operations can share one connection. Requires httpx.
+        """
+        if httpx is None:
+            raise ImportError('AsyncEndpoint requires httpx, which is not installed')
+        self.url: str = url
+        self._client: httpx.AsyncClient = httpx.AsyncClient(http2=importlib.util.find_spec('h2') is not None,
+                                                            headers=dict(_BASE_HEADERS))
+
+    async def post(self, operation: GraphQLOperation) -> dict:
+        # Per-operation headers (e.g. SchemaQuery's X-Auth-Token) are merged over the client's defaults
+        response = await self._client.post(self.url, content=operation.text_bytes, headers=operation.headers)
+        return _json_loads(response.content)
+
+    async def post_many(self, operations: list[GraphQLOperation]) -> list[dict]:
+        """
+        Send several operations concurrently.
+
+        :param operations: Queries and/or mutations to send.
+        :type operations: list[GraphQLOperation]
+        :return: JSON response for each operation, in the same order as operations.
+        :rtype: list[dict]
+        """
+        return list(await asyncio.gather(*(self.post(operation) for operation in operations)))
+
+    async def aclose(self):
+        """
+        Close this endpoint's HTTP client, releasing its connections.
+        """
+        await self._client.aclose()
+
+    async def __aenter__(self) -> AsyncEndpoint:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+
+# Whole-line comments in schema text, including the line's newline
+_COMMENT_LINE_RE: re.Pattern = re.compile(r'^[ \t]*#[^\n]*(?:\n|$)', re.MULTILINE)
+
+# Top-level schema entries: a type, enum or interface running up to the first line that is only '}' (group 1 is the
+# keyword), or a one-line union (group 2 is the keyword). Entries end at a line rather than at the first '}', as braces
+# also appear in directive arguments, e.g. @auth(query: { rule: "..." }), and in comments.
+_ITEM_RE: re.Pattern = re.compile(r'^[ \t]*(?:(type|enum|interface)\b[^\n]*\n(?:[^\n]*\n)*?[ \t]*\}[ \t]*$'
+                                  r'|(union)\b[^\n]*)', re.MULTILINE)
+
+# A single attribute line within a type or interface. Groups: name, type (including any "!"), directive, comment
+_ATTR_RE: re.Pattern = re.compile(r'\s*([^:\s,]+)\s*,?\s*:\s*([^@#,\s]+)[^@#]*(?:@([^@#]*)[^#]*)?(?:#(.*))?')
+
+
+def _iter_meaningful_lines(text: str) -> Iterator[str]:
+    """
+    Iterate over the lines of a schema entry's text in a single pass, skipping blank lines, comment lines and lines
+    that are only a brace.
+
+    :param text: Schema text for a single entry, e.g. a type or enum.
+    :type text: str
+    :return: Each remaining line, stripped of leading and trailing whitespace.
+    :rtype: Iterator[str]
+    """
+    for line in text.splitlines():
+        line = line.strip()
+        if line and not line.startswith('#') and line not in ('{', '}'):
+            yield line
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_attribute_text(text: str) -> tuple[str, str, bool, str | None, str | None]:
+    """
+    Parse an attribute line from a schema. Cached, as the same attribute line often appears in several types.
+
+    :param text: A line of schema text representing an attribute.
+    :type text: str
+    :return: Arguments for Schema.SchemaAttribute: name, attribute type, nullable, directive and comment.
+    :rtype: tuple[str, str, bool, str | None, str | None]
+    """
+    match: re.Match | None = _ATTR_RE.match(text)
+    if match is None:
+        raise AttributeError(f'Line in schema not recognised as an attribute:\n{text}')
+    name, full_type, directive, comment = match.groups()
+
+    attr_type: str = full_type.replace('!', '')
+    can_be_null: bool = '!' not in full_type
+
+    if directive is not None:
+        directive = directive.rstrip()
+
+    return name, attr_type, can_be_null, directive, comment
 
 
 class Schema:
     class SchemaAttribute:
+        __slots__ = ('name', 'attr_type', 'nullable', 'directive', 'comment', '_text')
+
         def __init__(self, name: str, attr_type: str, nullable: bool = True, directive: str = None,
                      comment: str = None):
-            self.name: str = name
-            self.attr_type: str = attr_type
+            # Names, types and directives recur across many attributes, so intern them to share one copy of each
+            self.name: str = sys.intern(name)
+            self.attr_type: str = sys.intern(attr_type)
             self.nullable: bool = nullable
-            self.directive: str = directive
+            self.directive: str = sys.intern(directive) if directive is not None else None
             self.comment: str = comment
 
-            nullable_text: str = "!" if self.nullable else ""
-            directive_text: str = f' @{self.directive}' if self.directive is not None else ''
-            comment_text: str = f' # {self.comment}' if self.comment is not None else ''
-            self.text: str = f'{self.name}: {self.attr_type}{nullable_text}{directive_text}{comment_text}'
+            self._text: str | None = None  # built on first read of text
+
+        @property
+        def text(self) -> str:
+            """
+            Schema text representation of the attribute. Only built when first read, as most attributes never are.
+
+            :return: Attribute text.
+            :rtype: str
+            """
+            if self._text is None:
+                nullable_text: str = "!" if self.nullable else ""
+                directive_text: str = f' @{self.directive}' if self.directive is not None else ''
+                comment_text: str = f' # {self.comment}' if self.comment is not None else ''
+                self._text = f'{self.name}: {self.attr_type}{nullable_text}{directive_text}{comment_text}'
+            return self._text
 
         @staticmethod
         def remove_trailing_comment(text: str) -> str:
@@ -76,34 +339,24 @@ class Schema:
 
         @classmethod
         def from_text(cls, text) -> Schema.SchemaAttribute:
-            chunks: list[str] = [chunk.strip() for chunk in text.split(':')]
-            comment: str = text.split('#')[-1] if '#' in text else None
-
-            name: str = chunks[0].replace(',', '')
-
-            attr_details = chunks[1].split('@')
-            attr_type: str = attr_details[0].replace('!', '').replace(',', '').strip()
-            can_be_null: bool = False if '!' in chunks[1] else True
-
-            if '@' in chunks[1]:
-                directive: str | None = Schema.SchemaAttribute.remove_trailing_comment(text.split('@')[1])
-            else:
-                directive = None
-
-            attr: Schema.SchemaAttribute = cls(name, attr_type, can_be_null, directive, comment)
+            attr: Schema.SchemaAttribute = cls(*_parse_attribute_text(text))
             return attr
 
     class SchemaItem:
+        __slots__ = ('name',)
+
         def __init__(self, name: str):
-            self.name: str = name
+            self.name: str = sys.intern(name)
 
     class SchemaType(SchemaItem):
+        __slots__ = ('attributes',)
+
         def __init__(self, name: str, attributes: list[Schema.SchemaAttribute]):
             super().__init__(name)
             self.attributes: list[Schema.SchemaAttribute] = attributes
 
         def __repr__(self):
-            attrs_text: str = "\n".join([f'\t- {attr.text}' for attr in self.attributes])
+            attrs_text: str = "\n".join(f'\t- {attr.text}' for attr in self.attributes)
             return f'SchemaType called "{self.name}" with attributes:\n{attrs_text}'
 
         @classmethod
@@ -116,24 +369,18 @@ class Schema:
             :return: SchemaType object matching the text.
             :rtype: SchemaType
             """
-            chunks: list[str] = [chunk.strip() for chunk in text.split('\n')
-                                 if not (chunk == '' or chunk.strip().startswith('#'))]
-
-            name: str = chunks[0].replace('type ', '').split(' ')[0]  # remove "type " then get first word
-            attributes = [chunk for chunk in chunks[1:] if chunk not in ['{', '}']]
-            attribute_objs: list[Schema.SchemaAttribute] = [Schema.SchemaAttribute.from_text(line)
-                                                            for line in attributes]
-
-            schema_type = cls(name, attribute_objs)
+            schema_type = cls(*Schema.parse_block(text))
             return schema_type
 
     class SchemaEnum(SchemaItem):
+        __slots__ = ('options',)
+
         def __init__(self, name: str, options: list[str]):
             super().__init__(name)
-            self.options: list[str] = options
+            self.options: list[str] = [sys.intern(option) for option in options]
 
         def __repr__(self):
-            options_text: str = "\n".join([f'\t- {option}' for option in self.options])
+            options_text: str = "\n".join(f'\t- {option}' for option in self.options)
             return f'SchemaEnum called "{self.name}" with options:\n{options_text}'
 
         @classmethod
@@ -146,24 +393,25 @@ class Schema:
             :return: SchemaEnum object matching the text.
             :rtype: SchemaEnum
             """
-            item_chunks: list[str] = [chunk.strip() for chunk in text.split('{')]
-            item_chunks = Schema.remove_comment_lines(item_chunks, True)
+            lines: Iterator[str] = _iter_meaningful_lines(text)
 
-            name = item_chunks[0].replace('enum ', '')  # just get enum's name
+            name: str = next(lines).split('{')[0].strip().replace('enum ', '')  # just get enum's name
 
-            # split options chunk into lines, remove } and remove whitespace at start or end of option
-            options: list[str] = [chunk.strip() for chunk in item_chunks[1].split('\n') if chunk != '}']
+            # remaining lines are the options, already stripped of whitespace with braces and comments removed
+            options: list[str] = list(lines)
 
             enum: Schema.SchemaEnum = cls(name, options)
             return enum
 
     class SchemaInterface(SchemaItem):
+        __slots__ = ('attributes',)
+
         def __init__(self, name: str, attributes: list[Schema.SchemaAttribute]):
             super().__init__(name)
             self.attributes: list[Schema.SchemaAttribute] = attributes
 
         def __repr__(self):
-            attrs_text: str = "\n".join([f'\t- {attr.text}' for attr in self.attributes])
+            attrs_text: str = "\n".join(f'\t- {attr.text}' for attr in self.attributes)
             return f'SchemaInterface called "{self.name}" with attributes:\n{attrs_text}'
 
         @classmethod
@@ -176,24 +424,18 @@ class Schema:
             :return: SchemaInterface object matching the text.
             :rtype: SchemaInterface
             """
-            chunks: list[str] = [chunk.strip() for chunk in text.split('\n')
-                                 if not (chunk == '' or chunk.strip().startswith('#'))]
-
-            name: str = chunks[0].replace('interface ', '').split(' ')[0]  # remove "type " then get first word
-            attributes = [chunk for chunk in chunks[1:] if chunk not in ['{', '}']]
-            attribute_objs: list[Schema.SchemaAttribute] = [Schema.SchemaAttribute.from_text(line)
-                                                            for line in attributes]
-
-            interface = cls(name, attribute_objs)
+            interface = cls(*Schema.parse_block(text))
             return interface
 
     class SchemaUnion(SchemaItem):
+        __slots__ = ('contents',)
+
         def __init__(self, name: str, contents: list[str]):
             super().__init__(name)
             self.contents: list[str] = contents
 
         def __repr__(self):
-            contents_text: str = "\n".join([f'\t- {content}' for content in self.contents])
+            contents_text: str = "\n".join(f'\t- {content}' for content in self.contents)
             return f'SchemaUnion called "{self.name}" with contents:\n{contents_text}'
 
         @classmethod
@@ -213,67 +455,154 @@ class Schema:
             union = cls(name, contents)
             return union
 
+    # Parser for each keyword that can start a schema entry
+    item_parsers: dict[str, Callable[[str], SchemaItem]] = {
+        'type': SchemaType.from_text,
+        'enum': SchemaEnum.from_text,
+        'interface': SchemaInterface.from_text,
+        'union': SchemaUnion.from_text,
+    }
+
+    # Attribute names for the sections of a generatedSchema query's text, in the order they appear
+    chunk_attrs: list[str] = ['input_schema', 'extended_definitions', 'generated_types', 'generated_enums',
+                              'generated_inputs', 'generated_query', 'generated_mutations']
+
     def __init__(self, schema_text: str):
         self.text: str = schema_text
 
+        for attr, chunk in Schema.split_schema_chunks(schema_text).items():
+            setattr(self, attr, chunk)
+
+    # Attributes about the data structures represented in the schema text. These are only parsed when first read.
+    # TODO replace the implementations of the below with appropriate SchemaQuerys (once that class fixed)
+    @functools.cached_property
+    def all_types(self) -> list[Schema.SchemaItem]:
+        # Each Schema parses its own items, so they can be changed without affecting other Schemas. Repeated fetches
+        # of the same schema text are cached as whole Schema objects by get_or_parse instead.
+        return self.parse_items(self.input_schema)
+
+    @functools.cached_property
+    def all_names(self) -> list[str]:
+        return [item.name for item in self.all_types]
+
+    @functools.cached_property
+    def _items_by_class(self) -> dict[type, list[Schema.SchemaItem]]:
+        # Sort items into a list per class in a single pass
+        buckets: dict[type, list[Schema.SchemaItem]] = {Schema.SchemaType: [], Schema.SchemaEnum: [],
+                                                         Schema.SchemaInterface: [], Schema.SchemaUnion: []}
+        for item in self.all_types:
+            buckets[type(item)].append(item)
+        return buckets
+
+    @functools.cached_property
+    def types(self) -> list[Schema.SchemaType]:
+        return self._items_by_class[Schema.SchemaType]
+
+    @functools.cached_property
+    def type_names(self) -> list[str]:
+        return [item.name for item in self.types]
+
+    @functools.cached_property
+    def enums(self) -> list[Schema.SchemaEnum]:
+        return self._items_by_class[Schema.SchemaEnum]
+
+    @functools.cached_property
+    def enum_names(self) -> list[str]:
+        return [item.name for item in self.enums]
+
+    @functools.cached_property
+    def interfaces(self) -> list[Schema.SchemaInterface]:
+        return self._items_by_class[Schema.SchemaInterface]
+
+    @functools.cached_property
+    def interface_names(self) -> list[str]:
+        return [item.name for item in self.interfaces]
+
+    @functools.cached_property
+    def unions(self) -> list[Schema.SchemaUnion]:
+        return self._items_by_class[Schema.SchemaUnion]
+
+    @functools.cached_property
+    def union_names(self) -> list[str]:
+        return [item.name for item in self.unions]
+
+    @staticmethod
+    def split_schema_chunks(schema_text: str) -> dict[str, str | None]:
+        """
+        Split a schema's text into its sections, keyed by the Schema attribute each section is stored in.
+
+        :param schema_text: Schema text, from either a "schema" or a "generatedSchema" query.
+        :type schema_text: str
+        :return: Dictionary mapping each name in Schema.chunk_attrs to its section of the text.
+        :rtype: dict[str, str | None]
+        """
         schema_chunks = schema_text.split('#######################') \
             if '#######################' in schema_text else None
-        schema_chunks = [chunk.removeprefix('\n\n').removesuffix('\n\n') for chunk in schema_chunks] \
+        schema_chunks = [chunk.strip('\n') for chunk in schema_chunks] \
             if schema_chunks is not None else None
 
-        attrs = ['input_schema', 'extended_definitions', 'generated_types', 'generated_enums', 'generated_inputs',
-                 'generated_query', 'generated_mutations']
-        for index, attr in enumerate(attrs):
-            # Set attributes for schema chunks. Only valid if text built by generatedSchema query (not just schema).
-            # Example: self.extended_definitions = schema_chunks[4]
-            setattr(self, attr, schema_chunks[(index + 1) * 2] if schema_chunks is not None else None)
+        # Sections are only valid if text built by generatedSchema query (not just schema).
+        # Example: chunks['extended_definitions'] = schema_chunks[4]
+        chunks: dict[str, str | None] = {attr: schema_chunks[(index + 1) * 2] if schema_chunks is not None else None
+                                         for index, attr in enumerate(Schema.chunk_attrs)}
 
         # if schema made by "schema" query, returned text is equivalent to input_schema from a "generatedSchema" query.
         if schema_chunks is None:
-            self.input_schema: str = self.text
-
-        # Attributes about the data structures represented in the schema text
-        # TODO replace the implementations of the below with appropriate SchemaQuerys (once that class fixed)
-        self.all_types: list[Schema.SchemaItem] = self.get_types()
-        self.all_names: list[str] = [item.name for item in self.all_types]
-
-        self.types = [item for item in self.types if isinstance(item, Schema.SchemaType)]
-        self.type_names: list[str] = [item.name for item in self.types]
-
-        self.enums = [item for item in self.types if isinstance(item, Schema.SchemaEnum)]
-        self.enum_names: list[str] = [item.name for item in self.enums]
+            chunks['input_schema'] = schema_text
 
-        self.interfaces = [item for item in self.types if isinstance(item, Schema.SchemaInterface)]
-        self.interface_names: list[str] = [item.name for item in self.interfaces]
-
-        self.unions = [item for item in self.types if isinstance(item, Schema.SchemaUnion)]
-        self.union_names: list[str] = [item.name for item in self.unions]
+        return chunks
 
     def get_types(self) -> list[Schema.SchemaItem]:
         """
-        Get a list of the types within the schema.
+        Get a list of every item within the schema, parsing them now if they haven't been already. The schema's
+        cached ``types`` attribute only holds SchemaType objects and is left unchanged.
 
-        :return: List of SchemaType objects representing each type entry in the schema.
-        :rtype: SchemaType
+        :return: List of SchemaItem objects representing each entry in the schema.
+        :rtype: list[SchemaItem]
         """
-        types: list[str] = self.text_to_chunks(self.input_schema)
-        types = self.remove_comment_lines(types, remove_blank_lines=True)
+        return list(self.all_types)
 
-        type_objs: list[Schema.SchemaItem] = []
-        for item in types:
-            if item.startswith('type'):
-                type_objs.append(Schema.SchemaType.from_text(item))
-            elif item.startswith('enum'):
-                type_objs.append(Schema.SchemaEnum.from_text(item))
-            elif item.startswith('interface'):
-                type_objs.append(Schema.SchemaInterface.from_text(item))
-            elif item.startswith('union'):
-                type_objs.append(Schema.SchemaUnion.from_text(item))
-            else:
-                raise AttributeError(f'Item in schema not recognised as type or enum:\n{item}')
+    @staticmethod
+    def parse_items(input_schema: str) -> list[Schema.SchemaItem]:
+        """
+        Parse each type, enum, interface and union entry in a schema's input text.
 
-        self.types: list[Schema.SchemaItem] = type_objs  # update schema's classes attribute
-        return self.types
+        :param input_schema: Input schema text.
+        :type input_schema: str
+        :return: List of SchemaItem objects representing each entry in the schema.
+        :rtype: list[SchemaItem]
+        """
+        text: str = _COMMENT_LINE_RE.sub('', input_schema)
+
+        keywords: list[str] = []
+        item_texts: list[str] = []
+        end: int = 0
+        for match in _ITEM_RE.finditer(text):
+            # Anything other than whitespace between entries is not a recognised schema entry
+            if text[end:match.start()].strip():
+                raise AttributeError(f'Item in schema not recognised as type or enum:\n{text[end:match.start()]}')
+            end = match.end()
+
+            keywords.append(match.group(1) or match.group(2))
+            item_texts.append(match.group(0).strip())
+
+        if text[end:].strip():
+            raise AttributeError(f'Item in schema not recognised as type or enum:\n{text[end:].strip()}')
+
+        # Entries are independent, so large schemas can optionally be parsed in worker processes (set by the
+        # DGRAPHPY_PARSE_WORKERS environment variable). Processes rather than threads, as parsing holds the GIL.
+        # A malformed value falls back to parsing inline rather than failing the parse.
+        try:
+            workers: int = int(os.getenv('DGRAPHPY_PARSE_WORKERS') or 0)
+        except ValueError:
+            workers = 0
+        if workers > 1 and len(item_texts) >= _PARALLEL_PARSE_MIN_ITEMS:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(_parse_schema_item, keywords, item_texts, chunksize=64))
+
+        type_objs: list[Schema.SchemaItem] = [_parse_schema_item(keyword, item_text)
+                                              for keyword, item_text in zip(keywords, item_texts)]
+        return type_objs
 
     @classmethod
     def from_SchemaQuery(cls, query: SchemaQuery, server: Server) -> 'Schema':
@@ -291,13 +620,74 @@ class Schema:
         schema_data: dict = response['data']['getGQLSchema']
 
         # Pull schema text from response dict. Dict key varies depending on query used to get schema data,
-        # so use query.text to determine corrected key to use
-        schema_text: str = schema_data.get('generatedSchema').replace('\u2010', '-') if 'generatedSchema' in query.text\
-            else schema_data.get('schema')
+        # so check whether the query's text requested the generatedSchema to determine the correct key to use. Checked
+        # here rather than stored on the query, as callers may set the query's text after building it.
+        schema_text: str = schema_data.get('generatedSchema').replace('\u2010', '-') \
+            if 'generatedSchema' in query.text else schema_data.get('schema')
 
-        schema = cls(schema_text)  # make a Schema object from the schema_text
+        schema = cls.get_or_parse(schema_text)  # make a Schema object from the schema_text, or reuse a cached one
         return schema
 
+    @classmethod
+    def from_SchemaQueries(cls, queries: list[SchemaQuery], server: Server) -> list[Schema]:
+        """
+        Build a Schema object for each of several SchemaQuerys, sending the queries to the server concurrently.
+
+        :param queries: Queries specifying which details of the schema should be retrieved from the server.
+        :type queries: list[SchemaQuery]
+        :param server: Server from which to get schema information.
+        :type server: Server
+        :return: Schema object for each query, in the same order as queries.
+        :rtype: list[Schema]
+        """
+        if not queries:
+            return []
+
+        # Requests share the server's session, whose connection pool is larger than the number of workers
+        workers: int = min(_MAX_SCHEMA_QUERY_WORKERS, len(queries))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda query: cls.from_SchemaQuery(query, server), queries))
+
+    @classmethod
+    def get_or_parse(cls, schema_text: str) -> Schema:
+        """
+        Get a Schema object for some schema text, reusing the one built for the same text previously if still cached.
+
+        :param schema_text: Schema text.
+        :type schema_text: str
+        :return: Schema object
+        :rtype: Schema
+        """
+        key: tuple[type, str] = (cls, hashlib.sha1(schema_text.encode()).hexdigest())
+        with _schema_cache_lock:
+            schema: Schema | None = _schema_cache.get(key)
+            if schema is not None:
+                _schema_cache.move_to_end(key)
+                return schema
+
+        schema = cls(schema_text)
+        with _schema_cache_lock:
+            _schema_cache[key] = schema
+            if len(_schema_cache) > _SCHEMA_CACHE_SIZE:
+                _schema_cache.popitem(last=False)  # evict least recently used
+        return schema
+
+    @staticmethod
+    def parse_block(text: str) -> tuple[str, list[Schema.SchemaAttribute]]:
+        """
+        Parse the text of a schema entry made up of a header line and one attribute per line, i.e. a type or interface.
+
+        :param text: Schema text representation of the entry.
+        :type text: str
+        :return: The entry's name and its attributes.
+        :rtype: tuple[str, list[Schema.SchemaAttribute]]
+        """
+        lines: Iterator[str] = _iter_meaningful_lines(text)
+
+        name: str = next(lines).split(None, 2)[1]  # second word of the header, e.g. "Person" in "type Person {"
+        attributes: list[Schema.SchemaAttribute] = [Schema.SchemaAttribute.from_text(line) for line in lines]
+        return name, attributes
+
     @staticmethod
     def remove_comment_lines(text_lines: list[str], remove_blank_lines: bool = False) -> list[str]:
         new_lines: list[str] = [item for item in text_lines if not item.startswith('#')]
@@ -305,7 +695,8 @@ class Schema:
             new_lines = [line for line in new_lines if line != '']
         return new_lines
 
-    def text_to_chunks(self, text: str) -> list[str]:
+    @staticmethod
+    def text_to_chunks(text: str) -> list[str]:
         """
         Converts a schema's text into a list of chunk strings each representing a schema entry.
 
@@ -323,7 +714,7 @@ class Schema:
         new_lines = [line for line in lines if line not in unions]
 
         # Remove comment lines and recombine to enable splitting into chunks with split('}\n')
-        text: str = '\n'.join(self.remove_comment_lines(new_lines))
+        text: str = '\n'.join(Schema.remove_comment_lines(new_lines))
 
         # Split into list of non-empty chunks, with each chunk representing a type/enum/interface/union
         types: list = [item.strip() for item in text.split('}\n') if item != '']
@@ -333,118 +724,273 @@ class Schema:
         return types
 
 
+# Minimum number of schema entries before parsing is split across worker processes, below which the cost of starting
+# the processes outweighs the gain
+_PARALLEL_PARSE_MIN_ITEMS: int = 500
+
+
+def _parse_schema_item(keyword: str, text: str) -> Schema.SchemaItem:
+    """
+    Parse a single schema entry. Module-level so it can be sent to worker processes.
+
+    :param keyword: Keyword the entry starts with: "type", "enum", "interface" or "union".
+    :type keyword: str
+    :param text: Schema text representation of the entry.
+    :type text: str
+    :return: SchemaItem object matching the text.
+    :rtype: SchemaItem
+    """
+    return Schema.item_parsers[keyword](text)
+
+
+# Schemas built by Schema.get_or_parse, keyed by class and SHA-1 of their text, in least to most recently used order
+_SCHEMA_CACHE_SIZE: int = 64
+_schema_cache: OrderedDict[tuple[type, str], Schema] = OrderedDict()
+_schema_cache_lock: threading.Lock = threading.Lock()
+
+
+# Argument keys whose string values are GraphQL names rather than string literals, so are not quoted
+_BAREWORD_ARGUMENTS: frozenset[str] = frozenset(('has',))
+
+
+@functools.lru_cache(maxsize=256)
+def _operation_template(gql_type: str, name: str, return_fields: tuple[str, ...],
+                        field_separator: str) -> tuple[str, str]:
+    """
+    Build the parts of a GraphQL operation's text that do not depend on its arguments. Cached, so repeated operations
+    of the same shape reuse them.
+
+    :param gql_type: GraphQL operation type, e.g. "query".
+    :type gql_type: str
+    :param name: Operation name.
+    :type name: str
+    :param return_fields: Fields to return.
+    :type return_fields: tuple[str, ...]
+    :param field_separator: Text to put between return fields.
+    :type field_separator: str
+    :return: Return fields text, and the operation text as a %-format string with one %s for the arguments text.
+    :rtype: tuple[str, str]
+    """
+    return_fields_text: str = f'{{{field_separator.join(return_fields)}}}'
+    # Escape any literal "%" either side of the arguments placeholder
+    before_args: str = f'{gql_type} {name} {{{name}'.replace('%', '%%')
+    after_args: str = f'{return_fields_text}}}'.replace('%', '%%')
+    template: str = f'{before_args}%s{after_args}'
+    return return_fields_text, template
+
+
+def _parse_arguments(args: dict, buf: list[str]):
+    """
+    Write the GraphQL-compatible string for an arguments dictionary into a shared buffer of string fragments.
+
+    :param args: arguments dictionary
+    :type args: dict
+    :param buf: fragments of the output string, appended to in order.
+    :type buf: list[str]
+    """
+    # Nested dictionaries are walked with an explicit stack of item iterators rather than by recursion. The top of
+    # the stack is the dictionary currently being written.
+    stack: list[Iterator[tuple[str, Any]]] = [iter(args.items())]
+    first: bool = True  # whether the next item is the first in its dictionary, so needs no separator
+    while stack:
+        # TODO correctly handle list values e.g. for anyofterms
+        for k, v in stack[-1]:
+            if not first:
+                buf.append(', ')
+            first = False
+            buf.append(k)
+
+            if isinstance(v, dict):
+                # Write the nested dictionary's items before carrying on with this one's
+                buf.append(': {')
+                stack.append(iter(v.items()))
+                first = True
+                break
+
+            # Look up the writer by exact type first, only falling back to isinstance checks for subclasses
+            write_value: Callable[[str, Any, list[str]], None] | None = _argument_writers.get(type(v))
+            if write_value is None:
+                write_value = next((writer for value_type, writer in _argument_writers.items()
+                                    if isinstance(v, value_type)), None)
+                if write_value is None:
+                    raise TypeError
+            write_value(k, v, buf)
+        else:
+            # All items of the dictionary on top of the stack written, so close it
+            stack.pop()
+            if stack:
+                buf.append('}')
+            first = False
+
+
+def _write_str_argument(k: str, v: str, buf: list[str]):
+    buf.append(': ' + v if k in _BAREWORD_ARGUMENTS else ': "' + v + '"')
+
+
+def _write_list_argument(k: str, v: list, buf: list[str]):
+    buf.append(': ' + ', '.join(v))
+
+
+# Function to write the text for each type of argument value, after the argument's key. Dictionaries are handled by
+# _parse_arguments itself.
+_argument_writers: dict[type, Callable[[str, Any, list[str]], None]] = {
+    str: _write_str_argument,
+    list: _write_list_argument,
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _default_endpoint() -> Endpoint:
+    """
+    Get the Endpoint for a standalone Dgraph instance, used when an operation is posted without one. Built on first
+    use rather than at import, then shared.
+
+    :return: Endpoint for 'localhost:9080'.
+    :rtype: Endpoint
+    """
+    return Endpoint('localhost:9080')
+
+
 class GraphQLOperation:
-    def __init__(self, gql_type: str, return_fields: list, name: str = None, arguments: dict = None):
+    __slots__ = ('name', 'gql_type', 'arguments', 'return_fields', 'headers', '_field_separator_used',
+                 '_return_fields_text', '_template', '_text', '_text_bytes')
+
+    # Return fields are separated by commas only, as the server doesn't need newlines. Newlines can be added with
+    # pretty=True to make the text easier to read when debugging.
+    _field_separator: str = ','
+    _pretty_field_separator: str = ',\n'
+
+    def __init__(self, gql_type: str, return_fields: list, name: str = None, arguments: dict = None,
+                 pretty: bool = False):
         """
         Class for GraphQL queries. See https://graphql.org/learn/queries/
         """
         self.name: str = name if name is not None else ''
         self.gql_type: str = gql_type
+        self.return_fields: list = return_fields
+        self.headers: dict | None = None
 
-        def parse_arguments(args: dict) -> str:
-            """
-            Convert an arguments dictionary into a GraphQL-compatible string.
-
-            :param args: arguments dictionary
-            :type args: dict
-            :return: GraphQL-compatible string
-            :rtype: str
-            """
-
-            gql_args = []
-
-            # TODO correctly handle list values e.g. for anyofterms
-            for k, v in args.items():
-                if isinstance(v, str):
-                    v = f'"{str(v)}"' if k != 'has' else str(v)
-                    item = str(k) + f': {v}'
-                elif isinstance(v, dict):
-                    v_text = parse_arguments(v)
-                    item = str(k) + ': {' + v_text + '}'
-                elif isinstance(v, list):
-                    item = f'{k}: {", ".join(v)}'
-                else:
-                    raise TypeError
-                gql_args.append(item)
-            return ', '.join(gql_args)
-
-        self.arguments = ''
+        # Arguments are serialized here rather than lazily, so unsupported values raise TypeError on construction
+        # instead of when the operation is first sent
+        arguments_text: str = ''
         if arguments is not None:
-            self.arguments: str = parse_arguments(arguments)
+            args_buf: list[str] = ['(']
+            _parse_arguments(arguments, args_buf)
 
             # if self.arguments.startswith('filter'):
             #     pass
             # if self.name.startswith('query'):
             #     self.arguments = 'filter: {' + self.arguments + '}'
 
-            self.arguments = '(' + self.arguments + ')'
-
-        self.return_fields: list = return_fields
-        self.return_fields_text: str = '{' + ",\n".join(return_fields) + '}'
-
-        self.text: str = f'{self.gql_type} {self.name} ' + \
-                         '{' + self.name + self.arguments + self.return_fields_text + '}'
-
-        self.headers: dict | None = None
-
-    def post(self, endpoint: Endpoint = Endpoint('localhost:9080')) -> dict:
+            args_buf.append(')')
+            arguments_text = ''.join(args_buf)
+        self.arguments: str = arguments_text
+
+        # The remaining text attributes are only built when first read
+        self._field_separator_used: str = self._pretty_field_separator if pretty else self._field_separator
+        self._return_fields_text: str | None = None
+        self._template: str | None = None
+        self._text: str | None = None
+        self._text_bytes: bytes | None = None
+
+    def _build_template(self):
+        # Everything but the arguments is the same for every operation of this type, name and return fields
+        self._return_fields_text, self._template = _operation_template(self.gql_type, self.name,
+                                                                       tuple(self.return_fields),
+                                                                       self._field_separator_used)
+
+    @property
+    def return_fields_text(self) -> str:
+        if self._return_fields_text is None:
+            self._build_template()
+        return self._return_fields_text
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            if self._template is None:
+                self._build_template()
+            self._text = self._template % self.arguments
+        return self._text
+
+    @text.setter
+    def text(self, text: str):
+        self._text = text
+        self._text_bytes = None
+
+    @property
+    def text_bytes(self) -> bytes:
+        if self._text_bytes is None:
+            self._text_bytes = self.text.encode('utf-8')  # encoded once rather than on every post
+        return self._text_bytes
+
+    def post(self, endpoint: Endpoint | None = None) -> dict:
         """
         Send this query or mutation to a given endpoint via HTTP POST.
 
-        :param endpoint: URL for endpoint. For standalone, use default ('localhost:9080')
-        :type endpoint: str
+        :param endpoint: Endpoint to send to. For standalone, use default (None, for 'localhost:9080')
+        :type endpoint: Endpoint | None
         :return: JSON response from endpoint server.
         :rtype: dict
         """
+        if endpoint is None:
+            endpoint = _default_endpoint()
         # response = requests.post(url=endpoint, data=self.query_text, headers=Endpoint.headers)
         # return response.json()
         return endpoint.post(self)
 
 
 class Query(GraphQLOperation):
-    def __init__(self, query_name: str, return_fields: list, arguments: dict = None):
+    __slots__ = ()
+    _valid_start_words: tuple[str, ...] = ('aggregate', 'get', 'query')
+
+    def __init__(self, query_name: str, return_fields: list, arguments: dict = None, pretty: bool = False):
         """
         Class for GraphQL queries. See https://graphql.org/learn/queries/
         """
-        valid_start_words: list[str] = ['aggregate', 'get', 'query']
-        if not any([query_name.startswith(start) for start in valid_start_words]):
-            raise AttributeError(f'Query name must start with one of the following: {valid_start_words}')
+        if not query_name.startswith(Query._valid_start_words):
+            raise AttributeError(f'Query name must start with one of the following: '
+                                 f'{list(Query._valid_start_words)}')
         else:
-            super().__init__('query', return_fields, query_name, arguments)
+            super().__init__('query', return_fields, query_name, arguments, pretty)
 
 
 # TODO add upsert ability
 class Mutation(GraphQLOperation):
-    def __init__(self, mutation_name: str, return_fields: list, arguments: dict = None):
+    __slots__ = ()
+    _valid_start_words: tuple[str, ...] = ('add', 'delete', 'update')
+
+    def __init__(self, mutation_name: str, return_fields: list, arguments: dict = None, pretty: bool = False):
         """
         Class for GraphQL mutations. See https://graphql.org/learn/queries/#mutations
         """
-        valid_start_words: list[str] = ['add', 'delete', 'update']
-        if not any([mutation_name.startswith(start) for start in valid_start_words]):
-            raise AttributeError(f'Mutation name must start with one of the following: {valid_start_words}')
+        if not mutation_name.startswith(Mutation._valid_start_words):
+            raise AttributeError(f'Mutation name must start with one of the following: '
+                                 f'{list(Mutation._valid_start_words)}')
         else:
-            super().__init__('mutation', return_fields, mutation_name, arguments)
+            super().__init__('mutation', return_fields, mutation_name, arguments, pretty)
 
 
 class SchemaQuery(GraphQLOperation):
+    __slots__ = ()
+
     def __init__(self, return_fields: list = None, arguments: dict = None, generated_schema: bool = False):
         return_fields = [''] if return_fields is None else return_fields
         arguments: dict = arguments if arguments is not None else None
         super().__init__('schema', return_fields, arguments=arguments)
 
-        return_fields_text: str | None = '{' + ' '.join(return_fields) + '}' if return_fields is not None else ''
-
         # # Text for query via POST request
         # self.text: str = ('{ getGQLSchema { ' + ('generatedSchema' if generated_schema else 'schema')
-        #              + return_fields_text + ' } }')
+        #              + self.return_fields_text + ' } }')
         arguments_text: str = f''  # FIXME
         self.text: str = """schema {}"""
         # FIXME Fix parsing of return fields etc into valid query string
 
         # self.text: str = 'schema {' + '\n'.join(return_fields) + '}'  # TODO remove
-        self.headers: dict = Server.headers
 
-        # Load X-Auth-Token API token from .env in same directory as this file
-        load_dotenv()
-        x_auth_token: str = os.getenv('X_AUTH_TOKEN')
-        self.headers['X-Auth-Token'] = x_auth_token
+        # X-Auth-Token API token from .env in same directory as this file. Only added when set, as httpx rejects
+        # headers whose value is None (requests silently drops them).
+        self.headers: dict = dict(_BASE_HEADERS)
+        auth_token: str | None = _auth_token()
+        if auth_token is not None:
+            self.headers['X-Auth-Token'] = auth_token
@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from dgraphpy import classes
+from dgraphpy.classes import AsyncEndpoint, SchemaQuery
+
+httpx = pytest.importorskip('httpx')
+
+
+def post_schema_query(monkeypatch, auth_token: str | None) -> httpx.Request:
+    monkeypatch.setattr(classes, '_auth_token', lambda: auth_token)
+    requests_sent: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_sent.append(request)
+        return httpx.Response(200, json={'data': {'getGQLSchema': {'schema': ''}}})
+
+    async def post() -> dict:
+        async with AsyncEndpoint('http://localhost:8080/admin') as endpoint:
+            await endpoint._client.aclose()
+            endpoint._client = httpx.AsyncClient(transport=httpx.MockTransport(handler),
+                                                 headers=dict(classes._BASE_HEADERS))
+            return await endpoint.post(SchemaQuery())
+
+    assert asyncio.run(post()) == {'data': {'getGQLSchema': {'schema': ''}}}
+    assert len(requests_sent) == 1
+    return requests_sent[0]
+
+
+def test_schema_query_without_auth_token(monkeypatch):
+    request: httpx.Request = post_schema_query(monkeypatch, None)
+
+    assert 'X-Auth-Token' not in request.headers
+    assert request.headers['Content-Type'] == 'application/graphql'
+
+
+def test_schema_query_with_auth_token(monkeypatch):
+    request: httpx.Request = post_schema_query(monkeypatch, 'token')
+
+    assert request.headers['X-Auth-Token'] == 'token'
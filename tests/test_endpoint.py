@@ -0,0 +1,95 @@
+import json
+from types import SimpleNamespace
+
+from dgraphpy.classes import Endpoint, Mutation, Query
+
+
+class StubSession:
+    """
+    Stands in for an Endpoint's requests Session, returning each queued JSON response in turn and recording what was
+    posted.
+    """
+    def __init__(self, responses: list[dict]):
+        self.responses: list[dict] = responses
+        self.posts: list[dict] = []
+
+    def post(self, url: str, data: bytes, headers: dict | None = None) -> SimpleNamespace:
+        self.posts.append({'url': url, 'data': data.decode('utf-8'), 'headers': headers})
+        return SimpleNamespace(content=json.dumps(self.responses.pop(0)).encode('utf-8'))
+
+    def close(self):
+        pass
+
+
+def stub_endpoint(responses: list[dict]) -> Endpoint:
+    endpoint = Endpoint('http://localhost:8080/graphql')
+    endpoint._session.close()
+    endpoint._session = StubSession(responses)
+    return endpoint
+
+
+def test_responses_mapped_back_in_order():
+    operations = [Query('getPerson', ['name']), Mutation('addPerson', ['numUids']), Query('queryPost', ['title'])]
+    endpoint = stub_endpoint([
+        {'data': {'a0': {'name': 'Alice'}, 'a2': [{'title': 'Hello'}]}},
+        {'data': {'a1': {'numUids': 1}}},
+    ])
+
+    responses: list[dict] = endpoint.post_batch(operations)
+
+    assert responses == [
+        {'data': {'getPerson': {'name': 'Alice'}}},
+        {'data': {'addPerson': {'numUids': 1}}},
+        {'data': {'queryPost': [{'title': 'Hello'}]}},
+    ]
+    query_post, mutation_post = endpoint._session.posts
+    assert query_post['data'].startswith('query Batch {')
+    assert 'a0: getPerson' in query_post['data'] and 'a2: queryPost' in query_post['data']
+    assert mutation_post['data'].startswith('mutation Batch {')
+    assert 'a1: addPerson' in mutation_post['data']
+
+
+def test_errors_routed_by_path():
+    operations = [Query('getPerson', ['name']), Query('queryPost', ['title'])]
+    error: dict = {'message': 'Post not found', 'path': ['a1', 'title']}
+    endpoint = stub_endpoint([{'data': {'a0': {'name': 'Alice'}, 'a1': None}, 'errors': [error]}])
+
+    responses: list[dict] = endpoint.post_batch(operations)
+
+    assert responses[0] == {'data': {'getPerson': {'name': 'Alice'}}}
+    assert responses[1] == {'data': {'queryPost': None}, 'errors': [error]}
+
+
+def test_errors_without_path_sent_to_every_operation():
+    operations = [Query('getPerson', ['name']), Query('queryPost', ['title'])]
+    error: dict = {'message': 'Invalid document'}
+    endpoint = stub_endpoint([{'errors': [error]}])
+
+    responses: list[dict] = endpoint.post_batch(operations)
+
+    assert responses == [
+        {'data': {'getPerson': None}, 'errors': [error]},
+        {'data': {'queryPost': None}, 'errors': [error]},
+    ]
+
+
+def test_operations_with_headers_posted_individually():
+    with_headers = Query('getPerson', ['name'])
+    with_headers.headers = {'X-Auth-Token': 'token'}
+    operations = [with_headers, Query('queryPost', ['title'])]
+    endpoint = stub_endpoint([
+        {'data': {'getPerson': {'name': 'Alice'}}},
+        {'data': {'a1': [{'title': 'Hello'}]}},
+    ])
+
+    responses: list[dict] = endpoint.post_batch(operations)
+
+    assert responses == [
+        {'data': {'getPerson': {'name': 'Alice'}}},
+        {'data': {'queryPost': [{'title': 'Hello'}]}},
+    ]
+    individual_post, batch_post = endpoint._session.posts
+    assert individual_post['data'] == with_headers.text
+    assert individual_post['headers'] == {'X-Auth-Token': 'token'}
+    assert 'a1: queryPost' in batch_post['data'] and 'getPerson' not in batch_post['data']
+    assert batch_post['headers'] is None
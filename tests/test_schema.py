@@ -0,0 +1,74 @@
+from dgraphpy.classes import Schema
+
+SCHEMA_TEXT: str = """# Test schema
+type Person {
+  name: String! # full name {first last}
+  friends: [Person]
+}
+
+enum Role {
+  ADMIN
+  USER
+}
+
+interface Node {
+  id: ID!
+}
+
+union Member = Person | Node
+
+type Post implements Node {
+  title: String
+}
+"""
+
+
+def test_items_bucketed_by_kind():
+    schema = Schema(SCHEMA_TEXT)
+
+    assert schema.type_names == ['Person', 'Post']
+    assert schema.enum_names == ['Role']
+    assert schema.interface_names == ['Node']
+    assert schema.union_names == ['Member']
+    assert all(isinstance(item, Schema.SchemaType) for item in schema.types)
+
+
+def test_get_types_leaves_types_unchanged():
+    schema = Schema(SCHEMA_TEXT)
+    type_names: list[str] = schema.type_names
+
+    items: list[Schema.SchemaItem] = schema.get_types()
+
+    assert [item.name for item in items] == ['Person', 'Role', 'Node', 'Member', 'Post']
+    assert [item.name for item in schema.types] == type_names
+    assert schema.enum_names == ['Role']
+
+
+def test_schemas_from_equal_text_do_not_share_items():
+    first = Schema(SCHEMA_TEXT)
+    second = Schema(SCHEMA_TEXT)
+
+    first.types[0].attributes.clear()
+
+    assert [attribute.name for attribute in second.types[0].attributes] == ['name', 'friends']
+
+
+def test_braces_in_directives_and_comments():
+    schema_text: str = '''type Todo @auth(query: { rule: "{ $USER: { eq: \\"admin\\" } }" }) {
+  id: ID!
+  text: String # note {x}
+  posts: [Post] @custom(http: {url: "http://localhost/posts", method: GET})
+}
+
+interface Node @auth(query: { rule: "query { queryNode { id } }" }) {
+  id: ID!
+}
+'''
+    items: list[Schema.SchemaItem] = Schema.parse_items(schema_text)
+
+    assert [item.name for item in items] == ['Todo', 'Node']
+    todo, node = items
+    assert [attribute.name for attribute in todo.attributes] == ['id', 'text', 'posts']
+    assert todo.attributes[1].comment == ' note {x}'
+    assert todo.attributes[2].directive == 'custom(http: {url: "http://localhost/posts", method: GET})'
+    assert [attribute.name for attribute in node.attributes] == ['id']